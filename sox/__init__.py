@@ -21,6 +21,7 @@ stream_handler.close()
 from . import file_info
 from .combine import Combiner
 from .transform import Transformer
+from .pool import TransformerPool
 from .core import SoxError
 from .core import SoxiError
 from .version import version as __version__
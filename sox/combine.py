@@ -7,6 +7,7 @@ This module requires that SoX is installed.
 
 from __future__ import print_function
 
+import logging
 from pathlib import Path
 from typing import Union, Optional, List
 
@@ -96,8 +97,7 @@ class Combiner(Transformer):
         except SoxiError:
             logger.warning("unable to validate file formats.")
 
-        args = []
-        args.extend(self.globals)
+        args = self._global_args()
         args.extend(['--combine', combine_type])
 
         input_args = _build_input_args(input_filepath_list, input_format_list)
@@ -114,14 +114,15 @@ class Combiner(Transformer):
                 "Stdout: {}\nStderr: {}".format(out, err)
             )
         else:
-            logger.info(
-                "Created %s with combiner %s and  effects: %s",
-                output_filepath,
-                combine_type,
-                " ".join(self.effects_log)
-            )
-            if out is not None:
-                logger.info("[SoX] {}".format(out))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Created %s with combiner %s and  effects: %s",
+                    output_filepath,
+                    combine_type,
+                    " ".join(self.effects_log)
+                )
+                if out is not None:
+                    logger.info("[SoX] %s", out)
             return True
 
     def preview(self,
@@ -154,7 +155,7 @@ class Combiner(Transformer):
 
         '''
         args = ["play", "--no-show-progress"]
-        args.extend(self.globals)
+        args.extend(self._global_args())
         args.extend(['--combine', combine_type])
 
         input_format_list = _build_input_format_list(
@@ -306,19 +307,19 @@ class Combiner(Transformer):
             input_format.append([])
 
         for i, f in enumerate(file_type):
-            input_format[i].extend(['-t', '{}'.format(f)])
+            input_format[i].extend(['-t', str(f)])
 
         for i, r in enumerate(rate):
-            input_format[i].extend(['-r', '{}'.format(r)])
+            input_format[i].extend(['-r', str(r)])
 
         for i, b in enumerate(bits):
-            input_format[i].extend(['-b', '{}'.format(b)])
+            input_format[i].extend(['-b', str(b)])
 
         for i, c in enumerate(channels):
-            input_format[i].extend(['-c', '{}'.format(c)])
+            input_format[i].extend(['-c', str(c)])
 
         for i, e in enumerate(encoding):
-            input_format[i].extend(['-e', '{}'.format(e)])
+            input_format[i].extend(['-e', str(e)])
 
         for i, l in enumerate(ignore_length):
             if l is True:
@@ -441,7 +442,7 @@ def _build_input_format_list(input_filepath_list: List[Path],
             fmts = [f for f in input_format]
 
     for i, (vol, fmt) in enumerate(zip(vols, fmts)):
-        input_format_list[i].extend(['-v', '{}'.format(vol)])
+        input_format_list[i].extend(['-v', str(vol)])
         input_format_list[i].extend(fmt)
 
     return input_format_list
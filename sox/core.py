@@ -1,9 +1,14 @@
 '''Base module for calling SoX '''
 
+import logging
+import os
+import shutil
 import subprocess
+import sys
+import threading
 from pathlib import Path
 from subprocess import CalledProcessError
-from typing import Union, List, Optional, Tuple, Iterable, Any
+from typing import Union, List, Optional, Tuple, Iterable, Iterator, Any
 
 import numpy as np
 from typing_extensions import Literal
@@ -22,6 +27,17 @@ EncodingValue = Literal[
     'oki-adpcm', 'ima-adpcm', 'ms-adpcm', 'gsm-full-rate'
 ]
 
+# Absolute path to the SoX binary, resolved once. Falls back to a PATH lookup
+# if SoX is not found.
+SOX_PATH = shutil.which('sox') or 'sox'
+
+# On Python 3.8 and 3.9, subprocess only starts SoX with posix_spawn instead
+# of fork, which avoids copying the page tables of a large parent process,
+# when close_fds is False. From Python 3.10, it uses vfork on Linux either
+# way, so the default is kept there and no inheritable descriptors leak
+# into SoX.
+_CLOSE_FDS = sys.version_info >= (3, 10)
+
 
 def sox(args: Iterable[str],
         src_array: Optional[np.ndarray] = None,
@@ -62,11 +78,13 @@ def sox(args: Iterable[str],
         args[0] = "sox"
 
     try:
-        logger.info("Executing: %s", ' '.join(args))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Executing: %s", ' '.join(args))
 
         if src_array is None:
             process_handle = subprocess.Popen(
-                args, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+                args, executable=SOX_PATH, close_fds=_CLOSE_FDS,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE
             )
 
             out, err = process_handle.communicate()
@@ -78,6 +96,8 @@ def sox(args: Iterable[str],
         elif isinstance(src_array, np.ndarray):
             process_handle = subprocess.Popen(
                 args,
+                executable=SOX_PATH,
+                close_fds=_CLOSE_FDS,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE
@@ -100,6 +120,236 @@ def sox(args: Iterable[str],
     return 1, None, None
 
 
+def sox_pipeline(args_list: List[Iterable[str]],
+                 decode_out_with_utf: bool = True) -> \
+        Tuple[int, Optional[Union[str, bytes]], Optional[str]]:
+    '''Pass a sequence of argument lists to SoX, piping the output of each
+    SoX process into the input of the next one.
+
+    Parameters
+    ----------
+    args_list : list of iterables
+        One argument list per SoX process, in order. The first item of each
+        list can, but does not need to, be 'sox'. Every process but the last
+        should write to stdout ('-'), and every process but the first should
+        read from stdin ('-').
+    decode_out_with_utf : bool, default=True
+        Whether or not the last process is outputting a bytestring that
+        should be decoded with utf-8. Set to False if it writes audio to
+        stdout ('-').
+
+    Returns
+    -------
+    status : int
+        0 on success, otherwise the first non-zero exit status.
+    out : str, bytes or None
+        Returns the stdout produced by the last process, as bytes if
+        decode_out_with_utf is False.
+        Returns None if there's an error.
+    err : str or None
+        Returns the stderr of all processes as a string.
+
+    '''
+    commands = []
+    for args in args_list:
+        # Explicitly convert python3 pathlib.Path objects to strings.
+        args = [str(x) for x in args]
+
+        if args[0].lower() != "sox":
+            args.insert(0, "sox")
+        else:
+            args[0] = "sox"
+        commands.append(args)
+
+    processes = []
+    # stderr of the upstream processes, drained from threads so that a
+    # process writing a lot to stderr never blocks the pipeline.
+    errs = [b''] * len(commands)
+    threads = []
+
+    def _drain_stderr(index, stream):
+        errs[index] = stream.read()
+
+    try:
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Executing: %s",
+                ' | '.join(' '.join(args) for args in commands)
+            )
+
+        stdin = None
+        for i, args in enumerate(commands):
+            if i < len(commands) - 1:
+                read_fd, write_fd = os.pipe()
+            else:
+                read_fd, write_fd = None, None
+
+            try:
+                processes.append(subprocess.Popen(
+                    args,
+                    executable=SOX_PATH,
+                    close_fds=_CLOSE_FDS,
+                    stdin=stdin,
+                    stdout=(
+                        subprocess.PIPE if write_fd is None else write_fd
+                    ),
+                    stderr=subprocess.PIPE
+                ))
+            except OSError:
+                if read_fd is not None:
+                    os.close(read_fd)
+                raise
+            finally:
+                # the child processes hold their own copies of the pipe ends
+                if stdin is not None:
+                    os.close(stdin)
+                if write_fd is not None:
+                    os.close(write_fd)
+            stdin = read_fd
+
+            if i < len(commands) - 1:
+                thread = threading.Thread(
+                    target=_drain_stderr, args=(i, processes[-1].stderr)
+                )
+                thread.daemon = True
+                thread.start()
+                threads.append(thread)
+
+        out, errs[-1] = processes[-1].communicate()
+        for thread in threads:
+            thread.join()
+        for process_handle in processes[:-1]:
+            process_handle.wait()
+            process_handle.stderr.close()
+
+        status = 0
+        for process_handle in processes:
+            if process_handle.returncode != 0:
+                status = process_handle.returncode
+                break
+
+        if decode_out_with_utf:
+            out = out.decode("utf-8")
+        err = "".join(e.decode("utf-8") for e in errs)
+        return status, out, err
+
+    except OSError as error_msg:
+        for process_handle in processes:
+            process_handle.kill()
+            process_handle.wait()
+        for thread in threads:
+            thread.join()
+        logger.error("OSError: SoX failed! %s", error_msg)
+    return 1, None, None
+
+
+def sox_stream(args: Iterable[str],
+               chunk_bytes: int,
+               src_array: Optional[np.ndarray] = None) -> Iterator[bytes]:
+    '''Pass an argument list to SoX and yield its stdout in chunks while
+    SoX is still running, instead of waiting for it to finish.
+
+    Parameters
+    ----------
+    args : iterable
+        Argument list for SoX. The first item can, but does not
+        need to, be 'sox'.
+    chunk_bytes : int
+        Size of the chunks to yield, in bytes. stdout is buffered with the
+        same size, so each chunk is read with as few system calls as
+        possible.
+    src_array : np.ndarray, or None
+        If src_array is not None, then we make sure it's a numpy
+        array and pass it into stdin.
+
+    Yields
+    ------
+    chunk : bytes
+        The next chunk of the stdout produced by sox. Every chunk but the
+        last one is chunk_bytes long.
+
+    Raises
+    ------
+    SoxError
+        If SoX exits with a non-zero status.
+
+    '''
+    # Explicitly convert python3 pathlib.Path objects to strings.
+    args = [str(x) for x in args]
+
+    if args[0].lower() != "sox":
+        args.insert(0, "sox")
+    else:
+        args[0] = "sox"
+
+    if src_array is not None and not isinstance(src_array, np.ndarray):
+        raise TypeError("src_array must be an np.ndarray!")
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Executing: %s", ' '.join(args))
+
+    try:
+        process_handle = subprocess.Popen(
+            args,
+            executable=SOX_PATH,
+            close_fds=_CLOSE_FDS,
+            stdin=subprocess.PIPE if src_array is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            bufsize=chunk_bytes
+        )
+    except OSError as error_msg:
+        logger.error("OSError: SoX failed! %s", error_msg)
+        raise SoxError("SoX failed! {}".format(error_msg))
+
+    # stderr is drained, and stdin fed, from threads so that SoX never
+    # blocks on a full pipe while we are waiting on stdout.
+    errs = []
+    threads = [threading.Thread(
+        target=lambda: errs.append(process_handle.stderr.read())
+    )]
+
+    if src_array is not None:
+        def _feed_stdin():
+            try:
+                # sox expects Fortran ordered samples, as in sox().
+                process_handle.stdin.write(src_array.T.tobytes(order='F'))
+            except BrokenPipeError:
+                pass
+            finally:
+                try:
+                    process_handle.stdin.close()
+                except BrokenPipeError:
+                    pass
+        threads.append(threading.Thread(target=_feed_stdin))
+
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+
+    finished = False
+    try:
+        while True:
+            chunk = process_handle.stdout.read(chunk_bytes)
+            if not chunk:
+                break
+            yield chunk
+        finished = True
+    finally:
+        if not finished:
+            # the consumer stopped early, SoX's output is no longer needed.
+            process_handle.kill()
+        process_handle.wait()
+        for thread in threads:
+            thread.join()
+        process_handle.stdout.close()
+        process_handle.stderr.close()
+
+    if process_handle.returncode != 0:
+        err = b"".join(errs).decode("utf-8")
+        raise SoxError("Stdout: None\nStderr: {}".format(err))
+
+
 class SoxError(Exception):
     '''Exception to be raised when SoX exits with non-zero status.
     '''
@@ -134,6 +384,32 @@ def _get_valid_formats() -> List[str]:
 VALID_FORMATS = _get_valid_formats()
 
 
+def _is_sox_ng() -> bool:
+    ''' Calls SoX --version to check whether the installed SoX is the
+    sox_ng fork.
+
+    Returns
+    -------
+    is_sox_ng : bool
+        True if the SoX binary on the path is sox_ng.
+
+    '''
+    if NO_SOX:
+        return False
+
+    try:
+        so = subprocess.check_output(['sox', '--version'])
+    except (OSError, CalledProcessError):
+        return False
+    if type(so) is not str:
+        so = str(so, encoding='UTF-8')
+
+    return 'sox_ng' in so.lower()
+
+
+SOX_NG = _is_sox_ng()
+
+
 def soxi(filepath: Union[str, Path], argument: str) -> str:
     ''' Base call to SoXI.
 
@@ -162,6 +438,8 @@ def soxi(filepath: Union[str, Path], argument: str) -> str:
     try:
         shell_output = subprocess.check_output(
             args,
+            executable=SOX_PATH,
+            close_fds=_CLOSE_FDS,
             stderr=subprocess.PIPE
         )
     except CalledProcessError as cpe:
@@ -197,7 +475,8 @@ def play(args: Iterable[str]) -> bool:
         args[0] = "play"
 
     try:
-        logger.info("Executing: %s", " ".join(args))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Executing: %s", " ".join(args))
         process_handle = subprocess.Popen(
             args, stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
@@ -1,5 +1,6 @@
 ''' Audio file info computed by soxi.
 '''
+import functools
 import os
 from numbers import Number
 from pathlib import Path
@@ -29,7 +30,7 @@ def bitdepth(input_filepath: Union[str, Path]) -> Optional[int]:
     '''
 
     validate_input_file(input_filepath)
-    output = soxi(input_filepath, 'b')
+    output = _soxi(input_filepath, 'b')
     if output == '0':
         logger.warning("Bit depth unavailable for %s", input_filepath)
         return None
@@ -54,7 +55,7 @@ def bitrate(input_filepath: Union[str, Path]) -> Optional[float]:
     '''
 
     validate_input_file(input_filepath)
-    output = soxi(input_filepath, 'B')
+    output = _soxi(input_filepath, 'B')
     # The characters below stand for kilo, Mega, Giga, etc.
     greek_prefixes = '\0kMGTPEZY'
     if output == "0":
@@ -82,7 +83,7 @@ def channels(input_filepath: Union[str, Path]) -> int:
         number of channels
     '''
     validate_input_file(input_filepath)
-    output = soxi(input_filepath, 'c')
+    output = _soxi(input_filepath, 'c')
     return int(output)
 
 
@@ -102,7 +103,7 @@ def comments(input_filepath: Union[str, Path]) -> str:
         If no comments are present, returns an empty string.
     '''
     validate_input_file(input_filepath)
-    output = soxi(input_filepath, 'a')
+    output = _soxi(input_filepath, 'a')
     return str(output)
 
 
@@ -122,7 +123,7 @@ def duration(input_filepath: Union[str, Path]) -> Optional[float]:
         If unavailable or empty, returns None.
     '''
     validate_input_file(input_filepath)
-    output = soxi(input_filepath, 'D')
+    output = _soxi(input_filepath, 'D')
     if float(output) == 0.0:
         logger.warning("Duration unavailable for %s", input_filepath)
         return None
@@ -144,7 +145,7 @@ def encoding(input_filepath: Union[str, Path]) -> str:
         audio encoding type
     '''
     validate_input_file(input_filepath)
-    output = soxi(input_filepath, 'e')
+    output = _soxi(input_filepath, 'e')
     return str(output)
 
 
@@ -163,7 +164,7 @@ def file_type(input_filepath: Union[str, Path]) -> str:
         file format type (ex. 'wav')
     '''
     validate_input_file(input_filepath)
-    output = soxi(input_filepath, 't')
+    output = _soxi(input_filepath, 't')
     return str(output)
 
 
@@ -184,7 +185,7 @@ def num_samples(input_filepath: Union[str, Path]) -> Optional[int]:
     '''
     input_filepath = str(input_filepath)
     validate_input_file(input_filepath)
-    output = soxi(input_filepath, 's')
+    output = _soxi(input_filepath, 's')
     if output == '0':
         logger.warning("Number of samples unavailable for %s", input_filepath)
         return None
@@ -206,7 +207,7 @@ def sample_rate(input_filepath: Union[str, Path]) -> float:
         number of samples/second
     '''
     validate_input_file(input_filepath)
-    output = soxi(input_filepath, 'r')
+    output = _soxi(input_filepath, 'r')
     return float(output)
 
 
@@ -238,6 +239,40 @@ def silent(input_filepath: Union[str, Path], threshold:float = 0.001) -> bool:
         return True
 
 
+@functools.lru_cache(maxsize=1024)
+def _soxi_cached(filepath: str, argument: str,
+                 mtime_ns: int, size: int) -> str:
+    '''Memoized call to SoXI. mtime_ns and size are only part of the cache
+    key, so that a file which changes on disk is probed again.
+    '''
+    return soxi(filepath, argument)
+
+
+def _soxi(filepath: Union[str, Path], argument: str) -> str:
+    '''Call to SoXI which reuses the result of a previous call for the same
+    file, as long as its modification time and size have not changed.
+    Saves a SoX process when the same file is probed repeatedly.
+
+    Parameters
+    ----------
+    filepath : path-like (str or pathlib.Path)
+        Path to audio file.
+
+    argument : str
+        Argument to pass to SoXI.
+
+    Returns
+    -------
+    shell_output : str
+        Command line output of SoXI
+    '''
+    filepath = os.path.abspath(str(filepath))
+    file_stat = os.stat(filepath)
+    return _soxi_cached(
+        filepath, argument, file_stat.st_mtime_ns, file_stat.st_size
+    )
+
+
 def validate_input_file(input_filepath: Union[str, Path]) -> None:
     '''Input file validation function. Checks that file exists and can be
     processed by SoX.
@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+'''
+Run independent Transformer builds in parallel.
+This module requires that SoX is installed.
+'''
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
+
+from .log import logger
+from .transform import Transformer
+
+
+class TransformerPool:
+    '''Pool of workers which applies the same chain of effects to many files
+    in parallel.
+
+    Each file is built by its own SoX process, so the work is spread over
+    threads rather than Python processes: the threads spend their time
+    waiting on SoX, which does not hold the GIL.
+
+    Methods
+    -------
+    map
+        Build a fresh Transformer for each (input, output) pair in parallel.
+
+    '''
+
+    def __init__(self, max_workers: Optional[int] = None):
+        '''
+        Parameters
+        ----------
+        max_workers : int or None, default=None
+            Maximum number of SoX processes to run at the same time.
+            If None, defaults to the number of CPUs.
+
+        '''
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+
+        if not isinstance(max_workers, int) or max_workers <= 0:
+            raise ValueError("max_workers must be a positive integer.")
+
+        self.max_workers = max_workers
+
+    def map(self,
+            transformer_factory: Callable[[], Transformer],
+            file_pairs: List[Tuple[Union[str, Path], Union[str, Path]]]
+            ) -> List[bool]:
+        '''Builds one output file per (input_filepath, output_filepath) pair,
+        running up to max_workers SoX processes in parallel.
+
+        Parameters
+        ----------
+        transformer_factory : callable
+            Function taking no arguments and returning a Transformer with
+            the effects to apply. It is called once per file pair, so each
+            build gets its own Transformer.
+        file_pairs : list of tuples
+            List of (input_filepath, output_filepath) pairs.
+
+        Returns
+        -------
+        status : list of bool
+            The result of Transformer.build for each pair, in order.
+            If a build fails, its exception is raised once the builds before
+            it have been collected.
+
+        Examples
+        --------
+        >>> import sox
+        >>> def make_transformer():
+        ...     tfm = sox.Transformer()
+        ...     tfm.pitch(2)
+        ...     return tfm
+        >>> pool = sox.TransformerPool()
+        >>> status = pool.map(
+                make_transformer,
+                [('path/to/in1.wav', 'path/to/out1.wav'),
+                 ('path/to/in2.wav', 'path/to/out2.wav')]
+            )
+
+        '''
+        if not callable(transformer_factory):
+            raise TypeError("transformer_factory must be callable.")
+
+        if not isinstance(file_pairs, list):
+            raise TypeError("file_pairs must be a list.")
+
+        if any(not isinstance(pair, tuple) or len(pair) != 2
+               for pair in file_pairs):
+            raise ValueError(
+                "file_pairs must be (input_filepath, output_filepath) tuples."
+            )
+
+        def _build(pair):
+            tfm = transformer_factory()
+            if not isinstance(tfm, Transformer):
+                raise TypeError(
+                    "transformer_factory must return a Transformer."
+                )
+            return tfm.build(pair[0], pair[1])
+
+        logger.info(
+            "Building %s files with %s workers",
+            len(file_pairs), self.max_workers
+        )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(_build, file_pairs))
@@ -7,25 +7,32 @@ This module requires that SoX is installed.
 
 from __future__ import print_function
 
+import itertools
+import logging
 import os
 import random
 from pathlib import Path
-from typing import List, Optional, Dict, Union, Tuple
+from typing import List, Optional, Dict, Union, Tuple, Iterator
 
 import numpy as np
 from typing_extensions import Literal
 
 from . import file_info
 from .core import ENCODING_VALS, EncodingValue
+from .core import SOX_NG
 from .core import SoxError
 from .core import VALID_FORMATS
 from .core import is_number
 from .core import play
 from .core import sox
+from .core import sox_pipeline
+from .core import sox_stream
 from .log import logger
 
 VERBOSITY_VALS = [0, 1, 2, 3, 4]
 
+BITDEPTH_VALS = [8, 16, 24, 32, 64]
+
 ENCODINGS_MAPPING = {
     np.int16: 's16',
     np.int8: 's8',
@@ -33,9 +40,48 @@ ENCODINGS_MAPPING = {
     np.float64: 'f64',
 }
 
+# Encoding names printed by soxi, mapped to the matching -e values.
+_SOXI_ENCODINGS = {
+    'Signed Integer PCM': 'signed-integer',
+    'Unsigned Integer PCM': 'unsigned-integer',
+    'Floating Point PCM': 'floating-point',
+    'A-law': 'a-law',
+    'u-law': 'u-law',
+}
+
 GainType = Literal['amplitude', 'power', 'db']
 
 
+def _global_flag_args(dither, guard, multithread, replay_gain):
+    '''Private helper function for the boolean global arguments of
+    set_globals
+    '''
+    global_args = []
+
+    if not dither:
+        global_args.append('-D')
+
+    if guard:
+        global_args.append('-G')
+
+    if multithread:
+        global_args.append('--multi-threaded')
+
+    if replay_gain:
+        global_args.append('--replay-gain')
+        global_args.append('track')
+
+    return tuple(global_args)
+
+
+# Global arguments for every combination of
+# (dither, guard, multithread, replay_gain), computed once at import.
+_GLOBALS_TABLE = {
+    flags: _global_flag_args(*flags)
+    for flags in itertools.product([False, True], repeat=4)
+}
+
+
 class Transformer:
     '''Audio file transformer.
     Class which allows multiple effects to be chained to create an output
@@ -53,6 +99,9 @@ class Transformer:
         Alias of build.
     build_array
         Execute the current chain of commands to create an output array.
+    build_stream
+        Execute the current chain of commands, yielding the output array in
+        chunks.
 
     '''
 
@@ -83,9 +132,10 @@ class Transformer:
 
     def set_globals(self, dither: bool = False,
                     guard: bool = False,
-                    multithread: bool = False,
+                    multithread: bool = True,
                     replay_gain: bool = False,
-                    verbosity: int = 2):
+                    verbosity: int = 2,
+                    buffer_size: Optional[int] = 131072):
         '''Sets SoX's global arguments.
         Overwrites any previously set global arguments.
         If this function is not explicity called, globals are set to this
@@ -97,8 +147,11 @@ class Transformer:
             If True, dithering is applied for low files with low bit rates.
         guard : bool, default=False
             If True, invokes the gain effect to guard against clipping.
-        multithread : bool, default=False
+        multithread : bool, default=True
             If True, each channel is processed in parallel.
+            With sox_ng, effect chains that normalise to the peak level
+            (norm, or gain with normalize=True) are run single-threaded,
+            because its parallel peak measurement is unreliable.
         replay_gain : bool, default=False
             If True, applies replay-gain adjustment to input-files.
         verbosity : int, default=2
@@ -113,6 +166,11 @@ class Transformer:
                 * 3 : Descriptions of SoX’s processing phases are also shown.
                     Useful for seeing exactly how SoX is processing your audio.
                 * 4, >4 : Messages to help with debugging SoX are also shown.
+        buffer_size : int or None, default=131072
+            Size in bytes of the buffers SoX uses for reading, writing and
+            processing audio. Larger buffers mean fewer read and write calls,
+            in particular when SoX reads from or writes to a pipe.
+            If None, SoX's default (8192) is used.
 
         '''
         if not isinstance(dither, bool):
@@ -133,20 +191,17 @@ class Transformer:
                     VERBOSITY_VALS)
             )
 
-        global_args = []
-
-        if not dither:
-            global_args.append('-D')
-
-        if guard:
-            global_args.append('-G')
+        if buffer_size is not None:
+            if (not isinstance(buffer_size, int) or
+                    isinstance(buffer_size, bool) or buffer_size <= 0):
+                raise ValueError('buffer_size must be a positive integer.')
 
-        if multithread:
-            global_args.append('--multi-threaded')
+        global_args = list(
+            _GLOBALS_TABLE[(dither, guard, multithread, replay_gain)]
+        )
 
-        if replay_gain:
-            global_args.append('--replay-gain')
-            global_args.append('track')
+        if buffer_size is not None:
+            global_args.extend(['--buffer', str(buffer_size)])
 
         global_args.append('-V{}'.format(verbosity))
 
@@ -210,19 +265,19 @@ class Transformer:
         input_format_args = []
 
         if file_type is not None:
-            input_format_args.extend(['-t', '{}'.format(file_type)])
+            input_format_args.extend(['-t', str(file_type)])
 
         if rate is not None:
             input_format_args.extend(['-r', '{:f}'.format(rate)])
 
         if bits is not None:
-            input_format_args.extend(['-b', '{}'.format(bits)])
+            input_format_args.extend(['-b', str(bits)])
 
         if channels is not None:
-            input_format_args.extend(['-c', '{}'.format(channels)])
+            input_format_args.extend(['-c', str(channels)])
 
         if encoding is not None:
-            input_format_args.extend(['-e', '{}'.format(encoding)])
+            input_format_args.extend(['-e', str(encoding)])
 
         if ignore_length:
             input_format_args.append('--ignore-length')
@@ -370,19 +425,19 @@ class Transformer:
         output_format_args = []
 
         if file_type is not None:
-            output_format_args.extend(['-t', '{}'.format(file_type)])
+            output_format_args.extend(['-t', str(file_type)])
 
         if rate is not None:
             output_format_args.extend(['-r', '{:f}'.format(rate)])
 
         if bits is not None:
-            output_format_args.extend(['-b', '{}'.format(bits)])
+            output_format_args.extend(['-b', str(bits)])
 
         if channels is not None:
-            output_format_args.extend(['-c', '{}'.format(channels)])
+            output_format_args.extend(['-c', str(channels)])
 
         if encoding is not None:
-            output_format_args.extend(['-e', '{}'.format(encoding)])
+            output_format_args.extend(['-e', str(encoding)])
 
         if comments is not None:
             if append_comments:
@@ -482,6 +537,23 @@ class Transformer:
         self.effects_log = list()
         return self
 
+    def _add_effect(self, effect_name, effect_args):
+        '''Private helper function for appending a validated effect to the
+        effects chain.
+
+        Parameters
+        ----------
+        effect_name : str
+            Name of the effect, recorded in effects_log.
+        effect_args : list or tuple of str
+            Arguments for the effect that will be passed to SoX. Effects
+            with a fixed number of arguments pass a tuple, which is cheaper
+            to build than a list and is constant-folded when all of its
+            items are literals.
+        '''
+        self.effects += effect_args
+        self.effects_log.append(effect_name)
+
     def _parse_inputs(self, input_filepath, input_array, sample_rate_in):
         '''Private helper function for parsing inputs to build and build_array
 
@@ -509,9 +581,8 @@ class Transformer:
         # set input parameters
         if input_filepath is not None:
             file_info.validate_input_file(input_filepath)
-            input_format = self.input_format
-            if input_format.get('channels') is None:
-                input_format['channels'] = file_info.channels(input_filepath)
+            # copied, as build_array fills in the probed channel count
+            input_format = dict(self.input_format)
         elif input_array is not None:
             if not isinstance(input_array, np.ndarray):
                 raise TypeError("input_array must be a numpy array or None")
@@ -536,6 +607,70 @@ class Transformer:
             )
         return input_format, input_filepath
 
+    def _global_args(self):
+        '''Private helper function for the global arguments passed to SoX.
+        Works around sox_ng's multi-threaded peak level measurement by
+        running peak normalising effect chains single-threaded.
+        '''
+        if not SOX_NG or '--multi-threaded' not in self.globals:
+            return list(self.globals)
+
+        normalizes = False
+        for i, token in enumerate(self.effects):
+            if token == 'norm' or (
+                token == 'gain' and '-n' in self.effects[i + 1:i + 3]
+            ):
+                normalizes = True
+                break
+
+        if not normalizes:
+            return list(self.globals)
+
+        logger.info(
+            "sox_ng detected: running peak normalisation single-threaded."
+        )
+        return [
+            '--single-threaded' if arg == '--multi-threaded' else arg
+            for arg in self.globals
+        ]
+
+    def _build_args(self, input_format, input_filepath, output_format,
+                    output_filepath, extra_args=None):
+        '''Private helper function for assembling the SoX argument list
+        used by build, build_array and chain
+
+        Parameters
+        ----------
+        input_format : dict
+            Input format dictionary
+        input_filepath : str
+            Formatted input filepath.
+        output_format : dict
+            Output format dictionary
+        output_filepath : str
+            Formatted output filepath.
+        extra_args : list or None, default=None
+            Additional arguments passed at the end of the list of effects.
+
+        Returns
+        -------
+        args : list of str
+            Argument list for SoX.
+        '''
+        args = self._global_args()
+        args.extend(self._input_format_args(input_format))
+        args.append(input_filepath)
+        args.extend(self._output_format_args(output_format))
+        args.append(output_filepath)
+        args.extend(self.effects)
+
+        if extra_args is not None:
+            if not isinstance(extra_args, list):
+                raise ValueError("extra_args must be a list.")
+            args.extend(extra_args)
+
+        return args
+
     def build(self,
               input_filepath: Optional[Union[str, Path]] = None,
               output_filepath: Optional[Union[str, Path]] = None,
@@ -626,18 +761,10 @@ class Transformer:
             )
         file_info.validate_output_file(output_filepath)
 
-        args = []
-        args.extend(self.globals)
-        args.extend(self._input_format_args(input_format))
-        args.append(input_filepath)
-        args.extend(self._output_format_args(self.output_format))
-        args.append(output_filepath)
-        args.extend(self.effects)
-
-        if extra_args is not None:
-            if not isinstance(extra_args, list):
-                raise ValueError("extra_args must be a list.")
-            args.extend(extra_args)
+        args = self._build_args(
+            input_format, input_filepath, self.output_format, output_filepath,
+            extra_args
+        )
 
         status, out, err = sox(args, input_array, True)
         if status != 0:
@@ -645,11 +772,12 @@ class Transformer:
                 "Stdout: {}\nStderr: {}".format(out, err)
             )
 
-        logger.info(
-            "Created %s with effects: %s",
-            output_filepath,
-            " ".join(self.effects_log)
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Created %s with effects: %s",
+                output_filepath,
+                " ".join(self.effects_log)
+            )
 
         if return_output:
             return status, out, err
@@ -738,6 +866,84 @@ class Transformer:
             extra_args, return_output
         )
 
+    def _array_output_format(self, input_format, input_filepath,
+                             sample_rate_in):
+        '''Private helper function for the raw output format used by
+        build_array and build_stream
+
+        Parameters
+        ----------
+        input_format : dict
+            Input format dictionary
+        input_filepath : str
+            Formatted input filepath.
+        sample_rate_in : int or None
+            Sample rate of the input array or None
+
+        Returns
+        -------
+        output_format : dict
+            Output format dictionary
+        encoding_out : type
+            numpy dtype of the output samples
+        '''
+        # the channel count is needed to reshape the output array, so probe
+        # the input file for it if it was not given explicitly.
+        if input_format.get('channels') is None:
+            input_format['channels'] = file_info.channels(input_filepath)
+
+        # check if any of the below commands are part of the effects chain
+        ignored_commands = ['rate', 'channels', 'convert']
+        if set(ignored_commands) & set(self.effects_log):
+            logger.warning(
+                "When outputting to an array, rate, channels and convert " +
+                "effects may be ignored. Use set_output_format() to " +
+                "specify output formats."
+            )
+
+        if input_format.get('file_type') is None:
+            encoding_out = np.int16
+        else:
+            encoding_out = [
+                k for k, v in ENCODINGS_MAPPING.items()
+                if input_format['file_type'] == v
+            ][0]
+
+        n_bits = np.dtype(encoding_out).itemsize * 8
+
+        output_format = {
+            'file_type': 'raw',
+            'rate': sample_rate_in,
+            'bits': n_bits,
+            'channels': input_format['channels'],
+            'encoding': None,
+            'comments': None,
+            'append_comments': True,
+        }
+
+        if self.output_format.get('rate') is not None:
+            output_format['rate'] = self.output_format['rate']
+
+        if self.output_format.get('channels') is not None:
+            output_format['channels'] = self.output_format['channels']
+
+        if self.output_format.get('bits') is not None:
+            n_bits = self.output_format['bits']
+            output_format['bits'] = n_bits
+
+        if n_bits == 8:
+            encoding_out = np.int8
+        elif n_bits == 16:
+            encoding_out = np.int16
+        elif n_bits == 32:
+            encoding_out = np.float32
+        elif n_bits == 64:
+            encoding_out = np.float64
+        else:
+            raise ValueError("invalid n_bits {}".format(n_bits))
+
+        return output_format, encoding_out
+
     def build_array(self,
                     input_filepath: Optional[Union[str, Path]] = None,
                     input_array: Optional[np.ndarray] = None,
@@ -805,70 +1011,13 @@ class Transformer:
             input_filepath, input_array, sample_rate_in
         )
 
-        # check if any of the below commands are part of the effects chain
-        ignored_commands = ['rate', 'channels', 'convert']
-        if set(ignored_commands) & set(self.effects_log):
-            logger.warning(
-                "When outputting to an array, rate, channels and convert " +
-                "effects may be ignored. Use set_output_format() to " +
-                "specify output formats."
-            )
-
-        output_filepath = '-'
-
-        if input_format.get('file_type') is None:
-            encoding_out = np.int16
-        else:
-            encoding_out = [
-                k for k, v in ENCODINGS_MAPPING.items()
-                if input_format['file_type'] == v
-            ][0]
-
-        n_bits = np.dtype(encoding_out).itemsize * 8
-
-        output_format = {
-            'file_type': 'raw',
-            'rate': sample_rate_in,
-            'bits': n_bits,
-            'channels': input_format['channels'],
-            'encoding': None,
-            'comments': None,
-            'append_comments': True,
-        }
-
-        if self.output_format.get('rate') is not None:
-            output_format['rate'] = self.output_format['rate']
-
-        if self.output_format.get('channels') is not None:
-            output_format['channels'] = self.output_format['channels']
-
-        if self.output_format.get('bits') is not None:
-            n_bits = self.output_format['bits']
-            output_format['bits'] = n_bits
-
-        if n_bits == 8:
-            encoding_out = np.int8
-        elif n_bits == 16:
-            encoding_out = np.int16
-        elif n_bits == 32:
-            encoding_out = np.float32
-        elif n_bits == 64:
-            encoding_out = np.float64
-        else:
-            raise ValueError("invalid n_bits {}".format(n_bits))
-
-        args = []
-        args.extend(self.globals)
-        args.extend(self._input_format_args(input_format))
-        args.append(input_filepath)
-        args.extend(self._output_format_args(output_format))
-        args.append(output_filepath)
-        args.extend(self.effects)
+        output_format, encoding_out = self._array_output_format(
+            input_format, input_filepath, sample_rate_in
+        )
 
-        if extra_args is not None:
-            if not isinstance(extra_args, list):
-                raise ValueError("extra_args must be a list.")
-            args.extend(extra_args)
+        args = self._build_args(
+            input_format, input_filepath, output_format, '-', extra_args
+        )
 
         status, out, err = sox(args, input_array, False)
         if status != 0:
@@ -884,13 +1033,100 @@ class Transformer:
                     int(len(out) / output_format['channels'])
                 ), order='F'
             ).T
-        logger.info(
-            "Created array with effects: %s",
-            " ".join(self.effects_log)
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Created array with effects: %s",
+                " ".join(self.effects_log)
+            )
 
         return out
 
+    def build_stream(self,
+                     input_filepath: Optional[Union[str, Path]] = None,
+                     input_array: Optional[np.ndarray] = None,
+                     sample_rate_in: Optional[float] = None,
+                     extra_args: Optional[List[str]] = None,
+                     chunk_bytes: int = 131072) -> Iterator[np.ndarray]:
+        '''Given an input file or array, yields the output as a sequence of
+        numpy arrays while SoX is still running, so the audio can be
+        processed without waiting for the whole output. The output format is
+        the same as for build_array.
+
+        Parameters
+        ----------
+        input_filepath : str or None
+            Either path to input audio file or None.
+        input_array : np.ndarray or None
+            A np.ndarray of an waveform with shape (n_samples, n_channels).
+            If this argument is passed, sample_rate_in must also be provided.
+            If None, input_filepath must be specified.
+        sample_rate_in : int
+            Sample rate of input_array.
+            This argument is ignored if input_array is None.
+        extra_args : list or None, default=None
+            If a list is given, these additional arguments are passed to SoX
+            at the end of the list of effects.
+            Don't use this argument unless you know exactly what you're doing!
+        chunk_bytes : int, default=131072
+            Approximate size of each yielded chunk in bytes. It is rounded
+            down to a whole number of frames.
+
+        Yields
+        ------
+        output_array : np.ndarray
+            The next chunk of output audio as a numpy array
+
+        Examples
+        --------
+
+        >>> import sox
+        >>> tfm = sox.Transformer()
+        >>> tfm.pitch(2)
+        >>> for chunk in tfm.build_stream(input_filepath='path/to/input.wav'):
+        ...     process(chunk)
+
+        '''
+        if (not isinstance(chunk_bytes, int) or isinstance(chunk_bytes, bool)
+                or chunk_bytes <= 0):
+            raise ValueError("chunk_bytes must be a positive integer.")
+
+        input_format, input_filepath = self._parse_inputs(
+            input_filepath, input_array, sample_rate_in
+        )
+
+        output_format, encoding_out = self._array_output_format(
+            input_format, input_filepath, sample_rate_in
+        )
+
+        args = self._build_args(
+            input_format, input_filepath, output_format, '-', extra_args
+        )
+
+        n_channels = output_format['channels']
+        frame_bytes = np.dtype(encoding_out).itemsize * n_channels
+        chunk_bytes = max(frame_bytes, chunk_bytes - chunk_bytes % frame_bytes)
+
+        return self._stream_arrays(
+            sox_stream(args, chunk_bytes, input_array), encoding_out,
+            n_channels
+        )
+
+    def _stream_arrays(self, chunks, encoding_out, n_channels):
+        '''Private helper function for build_stream, converting the raw
+        chunks of SoX's output to numpy arrays
+        '''
+        for chunk in chunks:
+            out = np.frombuffer(chunk, dtype=encoding_out)
+            if n_channels > 1:
+                out = out.reshape((-1, n_channels))
+            yield out
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Streamed array with effects: %s",
+                " ".join(self.effects_log)
+            )
+
     def preview(self, input_filepath: Union[str, Path]):
         '''Play a preview of the output with the current set of effects
 
@@ -901,7 +1137,7 @@ class Transformer:
 
         '''
         args = ["play", "--no-show-progress"]
-        args.extend(self.globals)
+        args.extend(self._global_args())
         args.extend(self.input_format)
         args.append(input_filepath)
         args.extend(self.effects)
@@ -932,12 +1168,11 @@ class Transformer:
         if not is_number(width_q) or width_q <= 0:
             raise ValueError("width_q must be a positive number.")
 
-        effect_args = [
+        effect_args = (
             'allpass', '{:f}'.format(frequency), '{:f}q'.format(width_q)
-        ]
+        )
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('allpass')
+        self._add_effect('allpass', effect_args)
         return self
 
     def bandpass(self, frequency: float, width_q: float = 2.0,
@@ -978,8 +1213,7 @@ class Transformer:
 
         effect_args.extend(['{:f}'.format(frequency), '{:f}q'.format(width_q)])
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('bandpass')
+        self._add_effect('bandpass', effect_args)
         return self
 
     def bandreject(self, frequency: float, width_q: float = 2.0,
@@ -1020,8 +1254,7 @@ class Transformer:
 
         effect_args.extend(['{:f}'.format(frequency), '{:f}q'.format(width_q)])
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('bandreject')
+        self._add_effect('bandreject', effect_args)
         return self
 
     def bass(self, gain_db: float,
@@ -1059,13 +1292,12 @@ class Transformer:
         if not is_number(slope) or slope <= 0 or slope > 1.0:
             raise ValueError("width_q must be a positive number.")
 
-        effect_args = [
+        effect_args = (
             'bass', '{:f}'.format(gain_db), '{:f}'.format(frequency),
             '{:f}s'.format(slope)
-        ]
+        )
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('bass')
+        self._add_effect('bass', effect_args)
         return self
 
     def bend(self,
@@ -1150,8 +1382,8 @@ class Transformer:
 
         effect_args = [
             'bend',
-            '-f', '{}'.format(frame_rate),
-            '-o', '{}'.format(oversample_rate)
+            '-f', str(frame_rate),
+            '-o', str(oversample_rate)
         ]
 
         last = 0
@@ -1163,8 +1395,7 @@ class Transformer:
             )
             last = end_times[i]
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('bend')
+        self._add_effect('bend', effect_args)
         return self
 
     def biquad(self, b: List[float], a: List[float]):
@@ -1200,14 +1431,13 @@ class Transformer:
         if not all([is_number(a_val) for a_val in a]):
             raise ValueError('all elements of a must be numbers.')
 
-        effect_args = [
+        effect_args = (
             'biquad', '{:f}'.format(b[0]), '{:f}'.format(b[1]),
             '{:f}'.format(b[2]), '{:f}'.format(a[0]),
             '{:f}'.format(a[1]), '{:f}'.format(a[2])
-        ]
+        )
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('biquad')
+        self._add_effect('biquad', effect_args)
         return self
 
     def channels(self, n_channels: int):
@@ -1230,10 +1460,9 @@ class Transformer:
         if not isinstance(n_channels, int) or n_channels <= 0:
             raise ValueError('n_channels must be a positive integer.')
 
-        effect_args = ['channels', '{}'.format(n_channels)]
+        effect_args = ('channels', str(n_channels))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('channels')
+        self._add_effect('channels', effect_args)
         return self
 
     def chorus(self,
@@ -1352,7 +1581,7 @@ class Transformer:
         else:
             shapes = [random.choice(['t', 's']) for _ in range(n_voices)]
 
-        effect_args = ['chorus', '{}'.format(gain_in), '{}'.format(gain_out)]
+        effect_args = ['chorus', str(gain_in), str(gain_out)]
 
         for i in range(n_voices):
             effect_args.extend([
@@ -1363,8 +1592,7 @@ class Transformer:
                 '-{}'.format(shapes[i])
             ])
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('chorus')
+        self._add_effect('chorus', effect_args)
         return self
 
     def compand(self,
@@ -1416,26 +1644,7 @@ class Transformer:
             raise TypeError("tf_points must be a list.")
         if len(tf_points) == 0:
             raise ValueError("tf_points must have at least one point.")
-        if any(not isinstance(pair, tuple) for pair in tf_points):
-            raise ValueError("elements of tf_points must be pairs")
-        if any(len(pair) != 2 for pair in tf_points):
-            raise ValueError("Tuples in tf_points must be length 2")
-        if any(not (is_number(p[0]) and is_number(p[1])) for p in tf_points):
-            raise ValueError("Tuples in tf_points must be pairs of numbers.")
-        if any((p[0] > 0 or p[1] > 0) for p in tf_points):
-            raise ValueError("Tuple values in tf_points must be <= 0 (dB).")
-        if len(tf_points) > len(set([p[0] for p in tf_points])):
-            raise ValueError("Found duplicate x-value in tf_points.")
-
-        tf_points = sorted(
-            tf_points,
-            key=lambda tf_points: tf_points[0]
-        )
-        transfer_list = []
-        for point in tf_points:
-            transfer_list.extend([
-                "{:f}".format(point[0]), "{:f}".format(point[1])
-            ])
+        transfer_list = _transfer_list(tf_points)
 
         effect_args = [
             'compand',
@@ -1449,8 +1658,7 @@ class Transformer:
         else:
             effect_args.append(",".join(transfer_list))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('compand')
+        self._add_effect('compand', effect_args)
         return self
 
     def contrast(self, amount=75):
@@ -1470,10 +1678,9 @@ class Transformer:
         if not is_number(amount) or amount < 0 or amount > 100:
             raise ValueError('amount must be a number between 0 and 100.')
 
-        effect_args = ['contrast', '{:f}'.format(amount)]
+        effect_args = ('contrast', '{:f}'.format(amount))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('contrast')
+        self._add_effect('contrast', effect_args)
         return self
 
     def convert(self,
@@ -1496,11 +1703,13 @@ class Transformer:
         rate
 
         '''
-        bitdepths = [8, 16, 24, 32, 64]
+        if samplerate is None and n_channels is None and bitdepth is None:
+            return self
+
         if bitdepth is not None:
-            if bitdepth not in bitdepths:
+            if bitdepth not in BITDEPTH_VALS:
                 raise ValueError(
-                    "bitdepth must be one of {}.".format(str(bitdepths))
+                    "bitdepth must be one of {}.".format(str(BITDEPTH_VALS))
                 )
             self.output_format['bits'] = bitdepth
         if n_channels is not None:
@@ -1531,10 +1740,9 @@ class Transformer:
         if not is_number(shift) or shift < -2 or shift > 2:
             raise ValueError('shift must be a number between -2 and 2.')
 
-        effect_args = ['dcshift', '{:f}'.format(shift)]
+        effect_args = ('dcshift', '{:f}'.format(shift))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('dcshift')
+        self._add_effect('dcshift', effect_args)
         return self
 
     def deemph(self):
@@ -1556,10 +1764,9 @@ class Transformer:
         --------
         bass, treble
         '''
-        effect_args = ['deemph']
+        effect_args = ('deemph',)
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('deemph')
+        self._add_effect('deemph', effect_args)
         return self
 
     def delay(self, positions: List[float]):
@@ -1583,8 +1790,7 @@ class Transformer:
         effect_args = ['delay']
         effect_args.extend(['{:f}'.format(p) for p in positions])
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('delay')
+        self._add_effect('delay', effect_args)
         return self
 
     def downsample(self, factor: int = 2):
@@ -1610,10 +1816,9 @@ class Transformer:
         if not isinstance(factor, int) or factor < 1:
             raise ValueError('factor must be a positive integer.')
 
-        effect_args = ['downsample', '{}'.format(factor)]
+        effect_args = ('downsample', str(factor))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('downsample')
+        self._add_effect('downsample', effect_args)
         return self
 
     def earwax(self):
@@ -1625,10 +1830,9 @@ class Transformer:
         Warning: Will only work properly on 44.1kHz stereo audio!
 
         '''
-        effect_args = ['earwax']
+        effect_args = ('earwax',)
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('earwax')
+        self._add_effect('earwax', effect_args)
         return self
 
     def echo(self,
@@ -1698,12 +1902,11 @@ class Transformer:
 
         for i in range(n_echos):
             effect_args.extend([
-                '{}'.format(delays[i]),
-                '{}'.format(decays[i])
+                str(delays[i]),
+                str(decays[i])
             ])
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('echo')
+        self._add_effect('echo', effect_args)
         return self
 
     def echos(self,
@@ -1777,8 +1980,7 @@ class Transformer:
                 '{:f}'.format(decays[i])
             ])
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('echos')
+        self._add_effect('echos', effect_args)
         return self
 
     def equalizer(self,
@@ -1812,14 +2014,13 @@ class Transformer:
         if not is_number(gain_db):
             raise ValueError("gain_db must be a number.")
 
-        effect_args = [
+        effect_args = (
             'equalizer',
             '{:f}'.format(frequency),
             '{:f}q'.format(width_q),
             '{:f}'.format(gain_db)
-        ]
-        self.effects.extend(effect_args)
-        self.effects_log.append('equalizer')
+        )
+        self._add_effect('equalizer', effect_args)
         return self
 
     def fade(self, fade_in_len: float = 0.0,
@@ -1863,18 +2064,17 @@ class Transformer:
 
         if fade_in_len > 0:
             effect_args.extend([
-                'fade', '{}'.format(fade_shape), '{:f}'.format(fade_in_len)
+                'fade', str(fade_shape), '{:f}'.format(fade_in_len)
             ])
 
         if fade_out_len > 0:
             effect_args.extend([
-                'reverse', 'fade', '{}'.format(fade_shape),
+                'reverse', 'fade', str(fade_shape),
                 '{:f}'.format(fade_out_len), 'reverse'
             ])
 
         if len(effect_args) > 0:
-            self.effects.extend(effect_args)
-            self.effects_log.append('fade')
+            self._add_effect('fade', effect_args)
 
         return self
 
@@ -1896,9 +2096,7 @@ class Transformer:
         effect_args = ['fir']
         effect_args.extend(['{:f}'.format(c) for c in coefficients])
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('fir')
-
+        self._add_effect('fir', effect_args)
         return self
 
     def flanger(self,
@@ -1950,21 +2148,19 @@ class Transformer:
         if interp not in ['linear', 'quadratic']:
             raise ValueError("interp must be one of 'linear' or 'quadratic'.")
 
-        effect_args = [
+        effect_args = (
             'flanger',
             '{:f}'.format(delay),
             '{:f}'.format(depth),
             '{:f}'.format(regen),
             '{:f}'.format(width),
             '{:f}'.format(speed),
-            '{}'.format(shape),
+            str(shape),
             '{:f}'.format(phase),
-            '{}'.format(interp)
-        ]
-
-        self.effects.extend(effect_args)
-        self.effects_log.append('flanger')
+            str(interp)
+        )
 
+        self._add_effect('flanger', effect_args)
         return self
 
     def gain(self,
@@ -2026,9 +2222,7 @@ class Transformer:
             effect_args.append('-l')
 
         effect_args.append('{:f}'.format(gain_db))
-        self.effects.extend(effect_args)
-        self.effects_log.append('gain')
-
+        self._add_effect('gain', effect_args)
         return self
 
     def highpass(self,
@@ -2070,9 +2264,7 @@ class Transformer:
         if n_poles == 2:
             effect_args.append('{:f}q'.format(width_q))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('highpass')
-
+        self._add_effect('highpass', effect_args)
         return self
 
     def lowpass(self,
@@ -2114,9 +2306,7 @@ class Transformer:
         if n_poles == 2:
             effect_args.append('{:f}q'.format(width_q))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('lowpass')
-
+        self._add_effect('lowpass', effect_args)
         return self
 
     def hilbert(self, num_taps: Optional[int] = None):
@@ -2143,11 +2333,9 @@ class Transformer:
         effect_args = ['hilbert']
 
         if num_taps is not None:
-            effect_args.extend(['-n', '{}'.format(num_taps)])
-
-        self.effects.extend(effect_args)
-        self.effects_log.append('hilbert')
+            effect_args.extend(['-n', str(num_taps)])
 
+        self._add_effect('hilbert', effect_args)
         return self
 
     def loudness(self, gain_db: float = -10.0, reference_level: float = 65.0):
@@ -2179,14 +2367,12 @@ class Transformer:
         if reference_level > 75 or reference_level < 50:
             raise ValueError('reference_level must be between 50 and 75')
 
-        effect_args = [
+        effect_args = (
             'loudness',
             '{:f}'.format(gain_db),
             '{:f}'.format(reference_level)
-        ]
-        self.effects.extend(effect_args)
-        self.effects_log.append('loudness')
-
+        )
+        self._add_effect('loudness', effect_args)
         return self
 
     def mcompand(self,
@@ -2297,21 +2483,7 @@ class Transformer:
                 "tf_points must be a list with at least one point."
             )
 
-        for tfp in tf_points:
-            if any(not isinstance(pair, tuple) for pair in tfp):
-                raise ValueError("elements of tf_points lists must be pairs")
-            if any(len(pair) != 2 for pair in tfp):
-                raise ValueError("Tuples in tf_points lists must be length 2")
-            if any(not (is_number(p[0]) and is_number(p[1])) for p in tfp):
-                raise ValueError(
-                    "Tuples in tf_points lists must be pairs of numbers."
-                )
-            if any((p[0] > 0 or p[1] > 0) for p in tfp):
-                raise ValueError(
-                    "Tuple values in tf_points lists must be <= 0 (dB)."
-                )
-            if len(tfp) > len(set([p[0] for p in tfp])):
-                raise ValueError("Found duplicate x-value in tf_points list.")
+        transfer_lists = [_transfer_list(tfp) for tfp in tf_points]
 
         if not isinstance(gain, list) or len(gain) != n_bands:
             raise ValueError("gain must be a list of length n_bands")
@@ -2328,16 +2500,7 @@ class Transformer:
 
             intermed_args = ["{:f},{:f}".format(attack_time[i], decay_time[i])]
 
-            tf_points_band = tf_points[i]
-            tf_points_band = sorted(
-                tf_points_band,
-                key=lambda tf_points_band: tf_points_band[0]
-            )
-            transfer_list = []
-            for point in tf_points_band:
-                transfer_list.extend([
-                    "{:f}".format(point[0]), "{:f}".format(point[1])
-                ])
+            transfer_list = transfer_lists[i]
 
             if soft_knee_db[i] is not None:
                 intermed_args.append(
@@ -2351,8 +2514,7 @@ class Transformer:
 
             effect_args.append(' '.join(intermed_args))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('mcompand')
+        self._add_effect('mcompand', effect_args)
         return self
 
     def noiseprof(self,
@@ -2422,14 +2584,12 @@ class Transformer:
         if not is_number(amount) or amount < 0 or amount > 1:
             raise ValueError("amount must be a number between 0 and 1.")
 
-        effect_args = [
+        effect_args = (
             'noisered',
             profile_path,
             '{:f}'.format(amount)
-        ]
-        self.effects.extend(effect_args)
-        self.effects_log.append('noisered')
-
+        )
+        self._add_effect('noisered', effect_args)
         return self
 
     def norm(self, db_level: float = -3.0):
@@ -2449,13 +2609,11 @@ class Transformer:
         if not is_number(db_level):
             raise ValueError('db_level must be a number.')
 
-        effect_args = [
+        effect_args = (
             'norm',
             '{:f}'.format(db_level)
-        ]
-        self.effects.extend(effect_args)
-        self.effects_log.append('norm')
-
+        )
+        self._add_effect('norm', effect_args)
         return self
 
     def oops(self):
@@ -2465,10 +2623,8 @@ class Transformer:
         has the effect of removing most or all of the vocals from a recording.
 
         '''
-        effect_args = ['oops']
-        self.effects.extend(effect_args)
-        self.effects_log.append('oops')
-
+        effect_args = ('oops',)
+        self._add_effect('oops', effect_args)
         return self
 
     def overdrive(self, gain_db: float = 20.0, colour: float = 20.0):
@@ -2488,14 +2644,12 @@ class Transformer:
         if not is_number(colour):
             raise ValueError('colour must be a number.')
 
-        effect_args = [
+        effect_args = (
             'overdrive',
             '{:f}'.format(gain_db),
             '{:f}'.format(colour)
-        ]
-        self.effects.extend(effect_args)
-        self.effects_log.append('overdrive')
-
+        )
+        self._add_effect('overdrive', effect_args)
         return self
 
     def pad(self, start_duration: float = 0.0, end_duration: float = 0.0):
@@ -2520,14 +2674,12 @@ class Transformer:
         if not is_number(end_duration) or end_duration < 0:
             raise ValueError("End duration must be positive.")
 
-        effect_args = [
+        effect_args = (
             'pad',
             '{:f}'.format(start_duration),
             '{:f}'.format(end_duration)
-        ]
-        self.effects.extend(effect_args)
-        self.effects_log.append('pad')
-
+        )
+        self._add_effect('pad', effect_args)
         return self
 
     def phaser(self,
@@ -2589,9 +2741,7 @@ class Transformer:
         elif modulation_shape == 'triangular':
             effect_args.append('-t')
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('phaser')
-
+        self._add_effect('phaser', effect_args)
         return self
 
     def pitch(self, n_semitones: float, quick: bool = False):
@@ -2633,9 +2783,7 @@ class Transformer:
 
         effect_args.append('{:f}'.format(n_semitones * 100.))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('pitch')
-
+        self._add_effect('pitch', effect_args)
         return self
 
     def rate(self, samplerate: float,
@@ -2669,14 +2817,12 @@ class Transformer:
                 "Quality must be one of {}.".format(' '.join(quality_vals))
             )
 
-        effect_args = [
+        effect_args = (
             'rate',
             '-{}'.format(quality),
             '{:f}'.format(samplerate)
-        ]
-        self.effects.extend(effect_args)
-        self.effects_log.append('rate')
-
+        )
+        self._add_effect('rate', effect_args)
         return self
 
     def remix(self,
@@ -2756,9 +2902,7 @@ class Transformer:
 
                 effect_args.append(out_channel)
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('remix')
-
+        self._add_effect('remix', effect_args)
         return self
 
     def repeat(self, count: int = 1):
@@ -2773,9 +2917,8 @@ class Transformer:
         if not isinstance(count, int) or count < 1:
             raise ValueError("count must be a postive integer.")
 
-        effect_args = ['repeat', '{}'.format(count)]
-        self.effects.extend(effect_args)
-        self.effects_log.append('repeat')
+        effect_args = ('repeat', str(count))
+        self._add_effect('repeat', effect_args)
 
     def reverb(self,
                reverberance: float = 50,
@@ -2853,18 +2996,14 @@ class Transformer:
             '{:f}'.format(wet_gain)
         ])
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('reverb')
-
+        self._add_effect('reverb', effect_args)
         return self
 
     def reverse(self):
         '''Reverse the audio completely
         '''
-        effect_args = ['reverse']
-        self.effects.extend(effect_args)
-        self.effects_log.append('reverse')
-
+        effect_args = ('reverse',)
+        self._add_effect('reverse', effect_args)
         return self
 
     def silence(self,
@@ -2942,9 +3081,7 @@ class Transformer:
         if location == -1:
             effect_args.append('reverse')
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('silence')
-
+        self._add_effect('silence', effect_args)
         return self
 
     def sinc(self,
@@ -3089,8 +3226,7 @@ class Transformer:
         if isinstance(transition_bw, list):
             effect_args.extend(['-t', '{:f}'.format(transition_bw[1])])
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('sinc')
+        self._add_effect('sinc', effect_args)
         return self
 
     def speed(self, factor: float):
@@ -3123,11 +3259,9 @@ class Transformer:
                 "Using an extreme factor. Quality of results will be poor"
             )
 
-        effect_args = ['speed', '{:f}'.format(factor)]
-
-        self.effects.extend(effect_args)
-        self.effects_log.append('speed')
+        effect_args = ('speed', '{:f}'.format(factor))
 
+        self._add_effect('speed', effect_args)
         return self
 
     def stat(self,
@@ -3310,11 +3444,9 @@ class Transformer:
                 "window must be a positive number."
             )
 
-        effect_args = ['stretch', '{:f}'.format(factor), '{:f}'.format(window)]
-
-        self.effects.extend(effect_args)
-        self.effects_log.append('stretch')
+        effect_args = ('stretch', '{:f}'.format(factor), '{:f}'.format(window))
 
+        self._add_effect('stretch', effect_args)
         return self
 
     def swap(self):
@@ -3328,10 +3460,8 @@ class Transformer:
         remix
 
         '''
-        effect_args = ['swap']
-        self.effects.extend(effect_args)
-        self.effects_log.append('swap')
-
+        effect_args = ('swap',)
+        self._add_effect('swap', effect_args)
         return self
 
     def tempo(self, factor: float,
@@ -3395,9 +3525,7 @@ class Transformer:
 
         effect_args.append('{:f}'.format(factor))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('tempo')
-
+        self._add_effect('tempo', effect_args)
         return self
 
     def treble(self, gain_db: float,
@@ -3435,14 +3563,12 @@ class Transformer:
         if not is_number(slope) or slope <= 0 or slope > 1.0:
             raise ValueError("width_q must be a positive number.")
 
-        effect_args = [
+        effect_args = (
             'treble', '{:f}'.format(gain_db), '{:f}'.format(frequency),
             '{:f}s'.format(slope)
-        ]
-
-        self.effects.extend(effect_args)
-        self.effects_log.append('treble')
+        )
 
+        self._add_effect('treble', effect_args)
         return self
 
     def tremolo(self, speed: float = 6.0, depth: float = 40.0):
@@ -3474,15 +3600,13 @@ class Transformer:
         if not is_number(depth) or depth <= 0 or depth > 100:
             raise ValueError("depth must be a positive number less than 100.")
 
-        effect_args = [
+        effect_args = (
             'tremolo',
             '{:f}'.format(speed),
             '{:f}'.format(depth)
-        ]
-
-        self.effects.extend(effect_args)
-        self.effects_log.append('tremolo')
+        )
 
+        self._add_effect('tremolo', effect_args)
         return self
 
     def trim(self, start_time: float, end_time: Optional[float] = None):
@@ -3512,9 +3636,7 @@ class Transformer:
 
             effect_args.append('{:f}'.format(end_time - start_time))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('trim')
-
+        self._add_effect('trim', effect_args)
         return self
 
     def upsample(self, factor: int = 2):
@@ -3537,11 +3659,9 @@ class Transformer:
         if not isinstance(factor, int) or factor < 1:
             raise ValueError('factor must be a positive integer.')
 
-        effect_args = ['upsample', '{}'.format(factor)]
-
-        self.effects.extend(effect_args)
-        self.effects_log.append('upsample')
+        effect_args = ('upsample', str(factor))
 
+        self._add_effect('upsample', effect_args)
         return self
 
     def vad(self,
@@ -3636,9 +3756,7 @@ class Transformer:
         if location == -1:
             effect_args.append('reverse')
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('vad')
-
+        self._add_effect('vad', effect_args)
         return self
 
     def vol(self, gain: float,
@@ -3700,7 +3818,192 @@ class Transformer:
             elif gain_type == 'db' and gain > 0:
                 effect_args.append('{:f}'.format(limiter_gain))
 
-        self.effects.extend(effect_args)
-        self.effects_log.append('vol')
-
+        self._add_effect('vol', effect_args)
         return self
+
+
+def _transfer_list(tf_points: List[Tuple[float, float]]) -> List[str]:
+    '''Private helper function for validating and formatting the transfer
+    function points of compand and mcompand. The points are checked with a
+    single conversion to a numpy array rather than one Python pass per check.
+
+    Parameters
+    ----------
+    tf_points : list of tuples
+        Transfer function points as a list of (dB, dB) tuples.
+
+    Returns
+    -------
+    transfer_list : list of str
+        Flattened point coordinates, sorted by input level.
+    '''
+    if any(not isinstance(pair, tuple) for pair in tf_points):
+        raise ValueError("elements of tf_points must be pairs")
+
+    try:
+        points = np.array(tf_points, dtype=float)
+    except (TypeError, ValueError):
+        raise ValueError("Tuples in tf_points must be pairs of numbers.")
+    # numpy converts None to nan rather than failing.
+    if np.isnan(points).any():
+        raise ValueError("Tuples in tf_points must be pairs of numbers.")
+    if points.ndim != 2 or points.shape[1] != 2:
+        raise ValueError("Tuples in tf_points must be length 2")
+    if (points > 0).any():
+        raise ValueError("Tuple values in tf_points must be <= 0 (dB).")
+    if np.unique(points[:, 0]).size < len(points):
+        raise ValueError("Found duplicate x-value in tf_points.")
+
+    points = points[points[:, 0].argsort()]
+    return ["{:f}".format(value) for value in points.ravel()]
+
+
+def _chain_output_format(output_format, input_filepath, output_filepath):
+    '''Private helper function for the output format of the last process
+    of chain
+
+    SoX reads the pipe between processes as 32 bit signed integer audio, so
+    without -b and -e it would not keep the bit depth and encoding of the
+    input file the way build does. They are only carried over when the
+    output file has the same type as the input file, so that the output
+    format is known to support them.
+
+    Parameters
+    ----------
+    output_format : dict
+        Output format dictionary of the last transformer
+    input_filepath : str
+        Path to the input audio file.
+    output_filepath : str
+        Path to the output audio file.
+
+    Returns
+    -------
+    output_format : dict
+        Output format dictionary
+    '''
+    output_format = dict(output_format)
+    if (output_format.get('bits') is not None
+            or output_format.get('encoding') is not None):
+        return output_format
+
+    output_type = (
+        output_format.get('file_type')
+        or file_info.file_extension(output_filepath)
+    )
+    if output_type != file_info.file_type(input_filepath):
+        return output_format
+
+    bits = file_info._soxi(input_filepath, 'b')
+    if bits != '0':
+        output_format['bits'] = int(bits)
+    output_format['encoding'] = _SOXI_ENCODINGS.get(
+        file_info.encoding(input_filepath)
+    )
+    return output_format
+
+
+def chain(transformers: List[Transformer],
+          input_filepath: Union[str, Path],
+          output_filepath: Union[str, Path],
+          return_output: bool = False):
+    '''Applies a sequence of transformers to an input file, one after the
+    other, and creates an output file on disk. Each transformer runs in its
+    own SoX process and the audio is piped from one process to the next, so
+    no intermediate files are written.
+
+    Parameters
+    ----------
+    transformers : list of Transformer
+        Transformers to apply, in order.
+    input_filepath : str
+        Path to input audio file. It is read using the input format of the
+        first transformer.
+    output_filepath : str
+        Path to desired output file. If a file already exists at
+        the given path, the file will be overwritten.
+        If '-n', no file is created.
+    return_output : bool, default=False
+        If True, returns the status and information sent to stderr and
+        stdout as a tuple (status, stdout, stderr).
+        If False, returns True on success.
+
+    Notes
+    -----
+    Audio is passed between processes in SoX's native format. Only the rate
+    and channels of the output format of the intermediate transformers are
+    used; the last transformer's output format is applied to the output file.
+    If the last transformer sets neither the output bits nor the encoding
+    and the output file has the same type as the input file, the output
+    file keeps the bit depth and encoding of the input file. Otherwise SoX
+    picks them as if the input were 32 bit signed integer audio.
+
+    Examples
+    --------
+    >>> import sox
+    >>> tfm1 = sox.Transformer()
+    >>> tfm1.pitch(3)
+    >>> tfm2 = sox.Transformer()
+    >>> tfm2.reverb()
+    >>> status = sox.transform.chain(
+            [tfm1, tfm2], 'path/to/input.wav', 'path/to/output.wav'
+        )
+
+    '''
+    if not isinstance(transformers, list) or len(transformers) == 0:
+        raise ValueError("transformers must be a non-empty list.")
+
+    if any(not isinstance(tfm, Transformer) for tfm in transformers):
+        raise TypeError("transformers must be Transformer objects.")
+
+    file_info.validate_input_file(input_filepath)
+
+    if input_filepath == output_filepath:
+        raise ValueError(
+            "input_filepath must be different from output_filepath."
+        )
+    file_info.validate_output_file(output_filepath)
+
+    args_list = []
+    for i, tfm in enumerate(transformers):
+        if i == 0:
+            input_format = tfm.input_format
+            stage_input = input_filepath
+        else:
+            input_format = {'file_type': 'sox'}
+            stage_input = '-'
+
+        if i == len(transformers) - 1:
+            output_format = _chain_output_format(
+                tfm.output_format, input_filepath, output_filepath
+            )
+            stage_output = output_filepath
+        else:
+            output_format = {
+                'file_type': 'sox',
+                'rate': tfm.output_format.get('rate'),
+                'channels': tfm.output_format.get('channels')
+            }
+            stage_output = '-'
+
+        args_list.append(tfm._build_args(
+            input_format, stage_input, output_format, stage_output
+        ))
+
+    status, out, err = sox_pipeline(args_list)
+    if status != 0:
+        raise SoxError(
+            "Stdout: {}\nStderr: {}".format(out, err)
+        )
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Created %s with effects: %s",
+            output_filepath,
+            " ".join(" ".join(tfm.effects_log) for tfm in transformers)
+        )
+
+    if return_output:
+        return status, out, err
+
+    return True
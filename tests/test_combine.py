@@ -27,7 +27,7 @@ class TestCombineDefault(unittest.TestCase):
         self.cbn = new_combiner()
 
     def test_globals(self):
-        expected = ['-D', '-V2']
+        expected = ['-D', '--multi-threaded', '--buffer', '131072', '-V2']
         actual = self.cbn.globals
         self.assertEqual(expected, actual)
 
@@ -1,9 +1,10 @@
 from pathlib import Path
 import unittest
+from unittest import mock
 import os
 
 from sox import core
-from sox.core import SoxiError
+from sox.core import SoxError, SoxiError
 
 
 def relpath(f):
@@ -70,6 +71,15 @@ class TestSox(unittest.TestCase):
         actual_status, _, _ = core.sox(args, arr)
         self.assertEqual(expected_status, actual_status)
 
+    @mock.patch('sox.core.subprocess.Popen')
+    def test_executable(self, popen):
+        popen.return_value.communicate.return_value = (b'', b'')
+        popen.return_value.returncode = 0
+        core.sox(['sox', INPUT_FILE, OUTPUT_FILE])
+        _, kwargs = popen.call_args
+        self.assertEqual(core.SOX_PATH, kwargs['executable'])
+        self.assertEqual(core._CLOSE_FDS, kwargs['close_fds'])
+
     def test_sox_fail_corrupt_file(self):
         args = [INPUT_FILE_CORRUPT, OUTPUT_FILE]
         expected_status = 2
@@ -80,6 +90,107 @@ class TestSox(unittest.TestCase):
         self.assertNotEqual('', acutal_err)
 
 
+class TestSoxPipeline(unittest.TestCase):
+
+    def test_base_case(self):
+        args_list = [
+            ['sox', INPUT_FILE, '-t', 'sox', '-'],
+            ['sox', '-t', 'sox', '-', OUTPUT_FILE]
+        ]
+        expected = (0, '', '')
+        actual = core.sox_pipeline(args_list)
+        self.assertEqual(expected, actual)
+
+    def test_base_case_pathlib(self):
+        args_list = [
+            [Path(INPUT_FILE), '-t', 'sox', '-'],
+            ['-t', 'sox', '-', Path(OUTPUT_FILE)]
+        ]
+        expected = (0, '', '')
+        actual = core.sox_pipeline(args_list)
+        self.assertEqual(expected, actual)
+
+    def test_three_stages(self):
+        args_list = [
+            [INPUT_FILE, '-t', 'sox', '-', 'reverse'],
+            ['-t', 'sox', '-', '-t', 'sox', '-', 'reverse'],
+            ['-t', 'sox', '-', OUTPUT_FILE]
+        ]
+        expected = (0, '', '')
+        actual = core.sox_pipeline(args_list)
+        self.assertEqual(expected, actual)
+
+    def test_verbose(self):
+        args_list = [
+            ['-V4', INPUT_FILE, '-t', 'sox', '-', 'reverse'],
+            ['-V4', '-t', 'sox', '-', '-t', 'sox', '-', 'reverse'],
+            ['-V4', '-t', 'sox', '-', OUTPUT_FILE]
+        ]
+        actual_status, _, actual_err = core.sox_pipeline(args_list)
+        self.assertEqual(0, actual_status)
+        self.assertNotEqual('', actual_err)
+
+    def test_stdout(self):
+        args_list = [
+            [INPUT_FILE, '-t', 'sox', '-'],
+            ['-t', 'sox', '-', '-t', 'raw', '-']
+        ]
+        actual_status, actual_out, _ = core.sox_pipeline(
+            args_list, decode_out_with_utf=False
+        )
+        _, expected_out, _ = core.sox(
+            [INPUT_FILE, '-t', 'raw', '-'], decode_out_with_utf=False
+        )
+        self.assertEqual(0, actual_status)
+        self.assertEqual(expected_out, actual_out)
+
+    def test_single(self):
+        args_list = [[INPUT_FILE, OUTPUT_FILE]]
+        expected = (0, '', '')
+        actual = core.sox_pipeline(args_list)
+        self.assertEqual(expected, actual)
+
+    def test_sox_fail_bad_files(self):
+        args_list = [
+            ['asdf.wav', '-t', 'sox', '-'],
+            ['-t', 'sox', '-', OUTPUT_FILE]
+        ]
+        actual_status, actual_out, actual_err = core.sox_pipeline(args_list)
+        self.assertNotEqual(0, actual_status)
+        self.assertNotEqual('', actual_err)
+
+
+class TestSoxStream(unittest.TestCase):
+
+    def test_base_case(self):
+        args = ['sox', INPUT_FILE, '-t', 'raw', '-']
+        chunks = list(core.sox_stream(args, 1024))
+        self.assertTrue(len(chunks) > 0)
+        self.assertTrue(all(len(c) == 1024 for c in chunks[:-1]))
+
+    def test_matches_sox(self):
+        args = [INPUT_FILE, '-t', 'raw', '-']
+        _, expected, _ = core.sox(args, decode_out_with_utf=False)
+        actual = b''.join(core.sox_stream(args, 1024))
+        self.assertEqual(expected, actual)
+
+    def test_sox_fail_bad_files(self):
+        args = ['asdf.wav', '-t', 'raw', '-']
+        with self.assertRaises(SoxError):
+            list(core.sox_stream(args, 1024))
+
+    def test_src_array_invalid(self):
+        args = ['-t', 's16', '-r', '8000', '-', '-t', 'raw', '-']
+        with self.assertRaises(TypeError):
+            list(core.sox_stream(args, 1024, 'not a numpy array'))
+
+    @mock.patch('sox.core.SOX_PATH', '/nonexistent/sox')
+    def test_sox_missing(self):
+        args = [INPUT_FILE, '-t', 'raw', '-']
+        with self.assertRaises(SoxError):
+            list(core.sox_stream(args, 1024))
+
+
 class TestGetValidFormats(unittest.TestCase):
 
     def setUp(self):
@@ -107,6 +218,35 @@ class TestGetValidFormats(unittest.TestCase):
         core.NO_SOX = False
 
 
+class TestIsSoxNg(unittest.TestCase):
+
+    def setUp(self):
+        self.no_sox = core.NO_SOX
+        core.NO_SOX = False
+
+    @mock.patch('sox.core.subprocess.check_output')
+    def test_sox(self, check_output):
+        check_output.return_value = b'sox:      SoX v14.4.2\n'
+        self.assertFalse(core._is_sox_ng())
+
+    @mock.patch('sox.core.subprocess.check_output')
+    def test_sox_ng(self, check_output):
+        check_output.return_value = b'sox_ng:   SoX_ng v14.5.0\n'
+        self.assertTrue(core._is_sox_ng())
+
+    @mock.patch('sox.core.subprocess.check_output')
+    def test_sox_fail(self, check_output):
+        check_output.side_effect = OSError()
+        self.assertFalse(core._is_sox_ng())
+
+    def test_nosox(self):
+        core.NO_SOX = True
+        self.assertFalse(core._is_sox_ng())
+
+    def tearDown(self):
+        core.NO_SOX = self.no_sox
+
+
 class TestValidFormats(unittest.TestCase):
 
     def test_wav(self):
@@ -155,6 +295,14 @@ class TestSoxi(unittest.TestCase):
         with self.assertRaises(SoxiError):
             core.soxi(INPUT_FILE_CORRUPT, 's')
 
+    @mock.patch('sox.core.subprocess.check_output')
+    def test_executable(self, check_output):
+        check_output.return_value = b'441000\n'
+        core.soxi(INPUT_FILE, 's')
+        _, kwargs = check_output.call_args
+        self.assertEqual(core.SOX_PATH, kwargs['executable'])
+        self.assertEqual(core._CLOSE_FDS, kwargs['close_fds'])
+
 
 @unittest.skip("Tests pass on local machine and fail on remote.")
 class TestPlay(unittest.TestCase):
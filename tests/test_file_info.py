@@ -238,6 +238,47 @@ class TestSampleRate(unittest.TestCase):
         self.assertEqual(expected, actual)
 
 
+class TestSoxiCache(unittest.TestCase):
+
+    def setUp(self):
+        file_info._soxi_cached.cache_clear()
+
+    def test_cache_hit(self):
+        file_info.channels(INPUT_FILE)
+        file_info.channels(INPUT_FILE)
+        self.assertEqual(1, file_info._soxi_cached.cache_info().hits)
+
+    def test_cache_hit_pathlib(self):
+        file_info.channels(INPUT_FILE)
+        file_info.channels(Path(INPUT_FILE))
+        self.assertEqual(1, file_info._soxi_cached.cache_info().hits)
+
+    def test_cache_miss_argument(self):
+        file_info.channels(INPUT_FILE)
+        file_info.sample_rate(INPUT_FILE)
+        self.assertEqual(0, file_info._soxi_cached.cache_info().hits)
+
+    def test_cache_miss_modified(self):
+        file_info.channels(INPUT_FILE)
+        file_stat = os.stat(INPUT_FILE)
+        os.utime(
+            INPUT_FILE,
+            ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1000)
+        )
+        try:
+            file_info.channels(INPUT_FILE)
+        finally:
+            os.utime(
+                INPUT_FILE,
+                ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns)
+            )
+        self.assertEqual(0, file_info._soxi_cached.cache_info().hits)
+
+    def test_nonexistent(self):
+        with self.assertRaises(IOError):
+            file_info._soxi('data/asdf.wav', 'c')
+
+
 class TestSilent(unittest.TestCase):
 
     def test_nonsilent(self):
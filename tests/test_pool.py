@@ -0,0 +1,103 @@
+import os
+import unittest
+
+from sox import pool, transform
+from sox.core import SoxError
+import soundfile as sf
+import numpy as np
+
+
+def relpath(f):
+    return os.path.join(os.path.dirname(__file__), f)
+
+
+INPUT_FILE = relpath('data/input.wav')
+INPUT_FILE4 = relpath('data/input4.wav')
+OUTPUT_FILE = relpath('data/output.wav')
+OUTPUT_FILE_ALT = relpath('data/output_alt.wav')
+
+
+def make_transformer():
+    tfm = transform.Transformer()
+    tfm.pad(0.5)
+    return tfm
+
+
+class TestTransformerPoolDefault(unittest.TestCase):
+
+    def test_max_workers(self):
+        tfm_pool = pool.TransformerPool()
+        self.assertEqual(os.cpu_count() or 1, tfm_pool.max_workers)
+
+    def test_max_workers_valid(self):
+        tfm_pool = pool.TransformerPool(max_workers=2)
+        self.assertEqual(2, tfm_pool.max_workers)
+
+    def test_max_workers_invalid(self):
+        with self.assertRaises(ValueError):
+            pool.TransformerPool(max_workers=0)
+
+    def test_max_workers_invalid2(self):
+        with self.assertRaises(ValueError):
+            pool.TransformerPool(max_workers=1.5)
+
+
+class TestTransformerPoolMap(unittest.TestCase):
+
+    def setUp(self):
+        self.tfm_pool = pool.TransformerPool(max_workers=2)
+
+    def test_valid(self):
+        actual = self.tfm_pool.map(
+            make_transformer,
+            [(INPUT_FILE, OUTPUT_FILE), (INPUT_FILE4, OUTPUT_FILE_ALT)]
+        )
+        expected = [True, True]
+        self.assertEqual(expected, actual)
+
+    def test_matches_build(self):
+        self.tfm_pool.map(make_transformer, [(INPUT_FILE, OUTPUT_FILE)])
+        actual, _ = sf.read(OUTPUT_FILE)
+
+        make_transformer().build(INPUT_FILE, OUTPUT_FILE_ALT)
+        expected, _ = sf.read(OUTPUT_FILE_ALT)
+
+        self.assertTrue(np.allclose(expected, actual))
+
+    def test_empty(self):
+        actual = self.tfm_pool.map(make_transformer, [])
+        expected = []
+        self.assertEqual(expected, actual)
+
+    def test_factory_invalid(self):
+        with self.assertRaises(TypeError):
+            self.tfm_pool.map(make_transformer(), [(INPUT_FILE, OUTPUT_FILE)])
+
+    def test_factory_return_invalid(self):
+        with self.assertRaises(TypeError):
+            self.tfm_pool.map(lambda: None, [(INPUT_FILE, OUTPUT_FILE)])
+
+    def test_file_pairs_invalid(self):
+        with self.assertRaises(TypeError):
+            self.tfm_pool.map(make_transformer, (INPUT_FILE, OUTPUT_FILE))
+
+    def test_file_pairs_invalid2(self):
+        with self.assertRaises(ValueError):
+            self.tfm_pool.map(make_transformer, [INPUT_FILE, OUTPUT_FILE])
+
+    def test_invalid_input(self):
+        with self.assertRaises(IOError):
+            self.tfm_pool.map(
+                make_transformer, [('blah/asdf.wav', OUTPUT_FILE)]
+            )
+
+    def test_failed_sox(self):
+        def make_bad_transformer():
+            tfm = transform.Transformer()
+            tfm.effects = ['channels', '-1']
+            return tfm
+
+        with self.assertRaises(SoxError):
+            self.tfm_pool.map(
+                make_bad_transformer, [(INPUT_FILE, OUTPUT_FILE)]
+            )
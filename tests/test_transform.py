@@ -1,6 +1,8 @@
 from pathlib import Path
 import os
+import subprocess
 import unittest
+from unittest import mock
 
 from sox import transform, file_info
 from sox.core import SoxError
@@ -17,6 +19,8 @@ INPUT_FILE = relpath('data/input.wav')
 INPUT_FILE4 = relpath('data/input4.wav')
 OUTPUT_FILE = relpath('data/output.wav')
 OUTPUT_FILE_ALT = relpath('data/output_alt.wav')
+OUTPUT_FILE_FLOAT = relpath('data/output_float.wav')
+OUTPUT_FILE_FLAC = relpath('data/output.flac')
 NOISE_PROF_FILE = relpath('data/noise.prof')
 
 
@@ -60,7 +64,7 @@ class TestTransformDefault(unittest.TestCase):
         self.transformer = transform.Transformer()
 
     def test_globals(self):
-        expected = ['-D', '-V2']
+        expected = ['-D', '--multi-threaded', '--buffer', '131072', '-V2']
         actual = self.transformer.globals
         self.assertEqual(expected, actual)
 
@@ -92,7 +96,7 @@ class TestTransformSetGlobals(unittest.TestCase):
 
     def test_defaults(self):
         actual = self.tfm.globals
-        expected = ['-D', '-V2']
+        expected = ['-D', '--multi-threaded', '--buffer', '131072', '-V2']
         self.assertEqual(expected, actual)
 
         actual_result = self.tfm.build(INPUT_FILE, OUTPUT_FILE)
@@ -101,7 +105,7 @@ class TestTransformSetGlobals(unittest.TestCase):
 
     def test_defaults_pathlib(self):
         actual = self.tfm.globals
-        expected = ['-D', '-V2']
+        expected = ['-D', '--multi-threaded', '--buffer', '131072', '-V2']
         self.assertEqual(expected, actual)
 
         actual_result = self.tfm.build(Path(INPUT_FILE), Path(OUTPUT_FILE))
@@ -111,7 +115,7 @@ class TestTransformSetGlobals(unittest.TestCase):
     def test_dither(self):
         self.tfm.set_globals(dither=True)
         actual = self.tfm.globals
-        expected = ['-V2']
+        expected = ['--multi-threaded', '--buffer', '131072', '-V2']
         self.assertEqual(expected, actual)
 
         actual_result = self.tfm.build(INPUT_FILE, OUTPUT_FILE)
@@ -125,7 +129,9 @@ class TestTransformSetGlobals(unittest.TestCase):
     def test_guard(self):
         self.tfm.set_globals(guard=True)
         actual = self.tfm.globals
-        expected = ['-D', '-G', '-V2']
+        expected = [
+            '-D', '-G', '--multi-threaded', '--buffer', '131072', '-V2'
+        ]
         self.assertEqual(expected, actual)
 
         actual_result = self.tfm.build(INPUT_FILE, OUTPUT_FILE)
@@ -137,9 +143,9 @@ class TestTransformSetGlobals(unittest.TestCase):
             self.tfm.set_globals(guard='-G')
 
     def test_multithread(self):
-        self.tfm.set_globals(multithread=True)
+        self.tfm.set_globals(multithread=False)
         actual = self.tfm.globals
-        expected = ['-D', '--multi-threaded', '-V2']
+        expected = ['-D', '--buffer', '131072', '-V2']
         self.assertEqual(expected, actual)
 
         actual_result = self.tfm.build(INPUT_FILE, OUTPUT_FILE)
@@ -153,7 +159,10 @@ class TestTransformSetGlobals(unittest.TestCase):
     def test_replay_gain(self):
         self.tfm.set_globals(replay_gain=True)
         actual = self.tfm.globals
-        expected = ['-D', '--replay-gain', 'track', '-V2']
+        expected = [
+            '-D', '--multi-threaded', '--replay-gain', 'track',
+            '--buffer', '131072', '-V2'
+        ]
         self.assertEqual(expected, actual)
 
         actual_result = self.tfm.build(INPUT_FILE, OUTPUT_FILE)
@@ -167,7 +176,7 @@ class TestTransformSetGlobals(unittest.TestCase):
     def test_verbosity(self):
         self.tfm.set_globals(verbosity=0)
         actual = self.tfm.globals
-        expected = ['-D', '-V0']
+        expected = ['-D', '--multi-threaded', '--buffer', '131072', '-V0']
         self.assertEqual(expected, actual)
 
         actual_result = self.tfm.build(INPUT_FILE, OUTPUT_FILE)
@@ -178,6 +187,83 @@ class TestTransformSetGlobals(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.tfm.set_globals(verbosity='debug')
 
+    def test_buffer_size(self):
+        self.tfm.set_globals(buffer_size=8192)
+        actual = self.tfm.globals
+        expected = ['-D', '--multi-threaded', '--buffer', '8192', '-V2']
+        self.assertEqual(expected, actual)
+
+        actual_result = self.tfm.build(INPUT_FILE, OUTPUT_FILE)
+        expected_result = True
+        self.assertEqual(expected_result, actual_result)
+
+    def test_buffer_size_none(self):
+        self.tfm.set_globals(buffer_size=None)
+        actual = self.tfm.globals
+        expected = ['-D', '--multi-threaded', '-V2']
+        self.assertEqual(expected, actual)
+
+    def test_buffer_size_invalid(self):
+        with self.assertRaises(ValueError):
+            self.tfm.set_globals(buffer_size=0)
+
+    def test_buffer_size_invalid2(self):
+        with self.assertRaises(ValueError):
+            self.tfm.set_globals(buffer_size=1024.5)
+
+    def test_buffer_size_invalid3(self):
+        with self.assertRaises(ValueError):
+            self.tfm.set_globals(buffer_size=True)
+
+
+class TestTransformGlobalArgs(unittest.TestCase):
+
+    def setUp(self):
+        self.tfm = new_transformer()
+        self.sox_ng = transform.SOX_NG
+        transform.SOX_NG = True
+
+    def test_no_normalize(self):
+        self.tfm.gain(-3.0, normalize=False)
+        actual = self.tfm._global_args()
+        expected = ['-D', '--multi-threaded', '--buffer', '131072', '-V2']
+        self.assertEqual(expected, actual)
+
+    def test_gain_normalize(self):
+        self.tfm.gain(-3.0, normalize=True)
+        actual = self.tfm._global_args()
+        expected = ['-D', '--single-threaded', '--buffer', '131072', '-V2']
+        self.assertEqual(expected, actual)
+
+    def test_gain_balance_normalize(self):
+        self.tfm.gain(-3.0, normalize=True, balance='B')
+        actual = self.tfm._global_args()
+        expected = ['-D', '--single-threaded', '--buffer', '131072', '-V2']
+        self.assertEqual(expected, actual)
+
+    def test_norm(self):
+        self.tfm.norm()
+        actual = self.tfm._global_args()
+        expected = ['-D', '--single-threaded', '--buffer', '131072', '-V2']
+        self.assertEqual(expected, actual)
+
+    def test_single_threaded(self):
+        self.tfm.set_globals(multithread=False)
+        self.tfm.norm()
+        actual = self.tfm._global_args()
+        expected = ['-D', '--buffer', '131072', '-V2']
+        self.assertEqual(expected, actual)
+
+    def test_not_sox_ng(self):
+        transform.SOX_NG = False
+        self.tfm.norm()
+        actual = self.tfm._global_args()
+        expected = ['-D', '--multi-threaded', '--buffer', '131072', '-V2']
+        self.assertEqual(expected, actual)
+
+    def tearDown(self):
+        transform.SOX_NG = self.sox_ng
+
 
 class TestTransformSetInputFormat(unittest.TestCase):
 
@@ -814,6 +900,204 @@ class TestTransformerBuildArray(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.tfm.build_array(INPUT_FILE)
 
+    def test_input_format_unchanged(self):
+        self.tfm.build_array(INPUT_FILE)
+        self.assertIsNone(self.tfm.input_format.get('channels'))
+
+        status = self.tfm.build(INPUT_FILE4, OUTPUT_FILE)
+        self.assertTrue(status)
+        self.assertEqual(2, file_info.channels(OUTPUT_FILE))
+
+
+class TestTransformerBuildStream(unittest.TestCase):
+    def setUp(self):
+        self.tfm = new_transformer()
+
+    def test_valid(self):
+        chunks = list(self.tfm.build_stream(INPUT_FILE))
+        self.assertTrue(len(chunks) > 0)
+        self.assertTrue(all(isinstance(c, np.ndarray) for c in chunks))
+
+    def test_matches_build_array(self):
+        self.tfm.pad(0.5)
+        expected = self.tfm.build_array(INPUT_FILE)
+        actual = np.concatenate(
+            list(self.tfm.build_stream(INPUT_FILE, chunk_bytes=4096))
+        )
+        self.assertTrue(np.array_equal(expected, actual))
+
+    def test_matches_build_array_multichannel(self):
+        expected = self.tfm.build_array(INPUT_FILE4)
+        actual = np.concatenate(
+            list(self.tfm.build_stream(INPUT_FILE4, chunk_bytes=4096))
+        )
+        self.assertTrue(np.array_equal(expected, actual))
+
+    def test_array_input(self):
+        input_array, rate = sf.read(INPUT_FILE, dtype='int16')
+        expected = self.tfm.build_array(
+            input_array=input_array, sample_rate_in=rate
+        )
+        actual = np.concatenate(list(self.tfm.build_stream(
+            input_array=input_array, sample_rate_in=rate
+        )))
+        self.assertTrue(np.array_equal(expected, actual))
+
+    def test_chunk_size(self):
+        chunks = list(self.tfm.build_stream(INPUT_FILE, chunk_bytes=1024))
+        self.assertTrue(all(c.nbytes == 1024 for c in chunks[:-1]))
+
+    def test_stop_early(self):
+        handles = []
+        popen = subprocess.Popen
+
+        def _popen(*args, **kwargs):
+            handles.append(popen(*args, **kwargs))
+            return handles[-1]
+
+        with mock.patch('sox.core.subprocess.Popen', side_effect=_popen):
+            stream = self.tfm.build_stream(INPUT_FILE, chunk_bytes=1024)
+            next(stream)
+            # does not raise SoxError for the killed process
+            stream.close()
+
+        self.assertEqual(1, len(handles))
+        # SoX is blocked on a full stdout pipe, so it was killed
+        self.assertTrue(handles[0].returncode < 0)
+        self.assertTrue(handles[0].stdout.closed)
+
+    def test_invalid(self):
+        with self.assertRaises(IOError):
+            self.tfm.build_stream('blah/asdf.wav')
+
+    def test_chunk_bytes_invalid(self):
+        with self.assertRaises(ValueError):
+            self.tfm.build_stream(INPUT_FILE, chunk_bytes=0)
+
+    def test_chunk_bytes_invalid2(self):
+        with self.assertRaises(ValueError):
+            self.tfm.build_stream(INPUT_FILE, chunk_bytes=True)
+
+    def test_extra_args_invalid(self):
+        with self.assertRaises(ValueError):
+            self.tfm.build_stream(INPUT_FILE, extra_args=0)
+
+    def test_failed_sox(self):
+        self.tfm.effects = ['channels', '-1']
+        with self.assertRaises(SoxError):
+            list(self.tfm.build_stream(INPUT_FILE))
+
+    def test_no_input(self):
+        with self.assertRaises(ValueError):
+            self.tfm.build_stream()
+
+
+class TestChain(unittest.TestCase):
+    def setUp(self):
+        self.tfm1 = new_transformer()
+        self.tfm1.pad(0.5)
+        self.tfm2 = new_transformer()
+        self.tfm2.reverse()
+
+    def test_valid(self):
+        status = transform.chain(
+            [self.tfm1, self.tfm2], INPUT_FILE, OUTPUT_FILE
+        )
+        self.assertTrue(status)
+
+    def test_single(self):
+        status = transform.chain([self.tfm1], INPUT_FILE, OUTPUT_FILE)
+        self.assertTrue(status)
+
+    def test_matches_single_transformer(self):
+        transform.chain([self.tfm1, self.tfm2], INPUT_FILE, OUTPUT_FILE)
+        actual, _ = sf.read(OUTPUT_FILE)
+
+        tfm = new_transformer()
+        tfm.pad(0.5)
+        tfm.reverse()
+        tfm.build(INPUT_FILE, OUTPUT_FILE_ALT)
+        expected, _ = sf.read(OUTPUT_FILE_ALT)
+
+        self.assertTrue(np.allclose(expected, actual))
+        self.assertEqual(
+            file_info.bitdepth(OUTPUT_FILE_ALT),
+            file_info.bitdepth(OUTPUT_FILE)
+        )
+
+    def test_output_bits(self):
+        self.tfm2.set_output_format(bits=32)
+        transform.chain([self.tfm1, self.tfm2], INPUT_FILE, OUTPUT_FILE)
+        self.assertEqual(32, file_info.bitdepth(OUTPUT_FILE))
+        self.assertEqual(32, self.tfm2.output_format['bits'])
+
+    def test_output_format_unchanged(self):
+        transform.chain([self.tfm1, self.tfm2], INPUT_FILE, OUTPUT_FILE)
+        self.assertIsNone(self.tfm2.output_format.get('bits'))
+        self.assertIsNone(self.tfm2.output_format.get('encoding'))
+
+    def test_float_input(self):
+        input_array, rate = sf.read(INPUT_FILE)
+        sf.write(OUTPUT_FILE_FLOAT, input_array, rate, subtype='FLOAT')
+        transform.chain(
+            [self.tfm1, self.tfm2], OUTPUT_FILE_FLOAT, OUTPUT_FILE
+        )
+
+        tfm = new_transformer()
+        tfm.pad(0.5)
+        tfm.reverse()
+        tfm.build(OUTPUT_FILE_FLOAT, OUTPUT_FILE_ALT)
+
+        self.assertEqual('Floating Point PCM', file_info.encoding(OUTPUT_FILE))
+        self.assertEqual(
+            file_info.encoding(OUTPUT_FILE_ALT),
+            file_info.encoding(OUTPUT_FILE)
+        )
+        self.assertEqual(
+            file_info.bitdepth(OUTPUT_FILE_ALT),
+            file_info.bitdepth(OUTPUT_FILE)
+        )
+
+    def test_float_input_flac_output(self):
+        input_array, rate = sf.read(INPUT_FILE)
+        sf.write(OUTPUT_FILE_FLOAT, input_array, rate, subtype='FLOAT')
+        status = transform.chain(
+            [self.tfm1, self.tfm2], OUTPUT_FILE_FLOAT, OUTPUT_FILE_FLAC
+        )
+        self.assertTrue(status)
+
+    def test_return_output(self):
+        status, out, err = transform.chain(
+            [self.tfm1, self.tfm2], INPUT_FILE, OUTPUT_FILE,
+            return_output=True
+        )
+        self.assertEqual(0, status)
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            transform.chain([], INPUT_FILE, OUTPUT_FILE)
+
+    def test_not_list(self):
+        with self.assertRaises(ValueError):
+            transform.chain(self.tfm1, INPUT_FILE, OUTPUT_FILE)
+
+    def test_not_transformer(self):
+        with self.assertRaises(TypeError):
+            transform.chain([self.tfm1, 'reverse'], INPUT_FILE, OUTPUT_FILE)
+
+    def test_invalid_input(self):
+        with self.assertRaises(IOError):
+            transform.chain([self.tfm1], 'blah/asdf.wav', OUTPUT_FILE)
+
+    def test_input_output_equal(self):
+        with self.assertRaises(ValueError):
+            transform.chain([self.tfm1], INPUT_FILE, INPUT_FILE)
+
+    def test_failed_sox(self):
+        self.tfm2.effects = ['channels', '-1']
+        with self.assertRaises(SoxError):
+            transform.chain([self.tfm1, self.tfm2], INPUT_FILE, OUTPUT_FILE)
+
 
 class TestTransformerClearEffects(unittest.TestCase):
 
@@ -1619,6 +1903,11 @@ class TestTransformerCompand(unittest.TestCase):
         with self.assertRaises(ValueError):
             tfm.compand(tf_points=[(0, 2), (40, -20)])
 
+    def test_tf_points_tup_none(self):
+        tfm = new_transformer()
+        with self.assertRaises(ValueError):
+            tfm.compand(tf_points=[(None, -1.0)])
+
     def test_tf_points_tup_dups(self):
         tfm = new_transformer()
         with self.assertRaises(ValueError):
@@ -3174,6 +3463,11 @@ class TestTransformerMcompand(unittest.TestCase):
         with self.assertRaises(ValueError):
             tfm.mcompand(tf_points=[[(0, 2), (40, -20)], [(0, 0)]])
 
+    def test_tf_points_tup_none(self):
+        tfm = new_transformer()
+        with self.assertRaises(ValueError):
+            tfm.mcompand(tf_points=[[(None, -1.0)], [(-2.0, -3.0)]])
+
     def test_tf_points_tup_dups(self):
         tfm = new_transformer()
         with self.assertRaises(ValueError):